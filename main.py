@@ -2,32 +2,159 @@ import subprocess
 import sys
 import time
 import logging
+import logging.handlers
+import queue
 import signal
 import os
 import threading
+import selectors
+import fcntl
 import psutil
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-from concurrent.futures import ThreadPoolExecutor
 import re
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+@dataclass(slots=True, frozen=True)
+class BotInfo:
+    """Per-bot data resolved once at startup"""
+    index: int
+    path: Path
+    path_str: str
+    cwd: Optional[str]
+    argv: tuple
+    logger: logging.Logger
+
+
+class LogQueue(queue.Queue):
+    """Log queue bounded by record count and by total message size, counting records dropped while full"""
+
+    def __init__(self, maxsize: int, max_chars: int):
+        super().__init__(maxsize)
+        self.max_chars = max_chars
+        self.queued_chars = 0
+        self.dropped = 0
+
+    @staticmethod
+    def record_size(record) -> int:
+        return len(record.msg) if isinstance(getattr(record, 'msg', None), str) else 0
+
+    def put(self, item, block=True):
+        # Same as Queue.put, but also waits while the size budget is used up;
+        # a single oversized record is still accepted into an empty queue
+        size = self.record_size(item)
+        with self.not_full:
+            while (self._qsize() >= self.maxsize
+                   or (self.queued_chars and self.queued_chars + size > self.max_chars)):
+                if not block:
+                    raise queue.Full
+                self.not_full.wait()
+            self._put(item)
+            self.queued_chars += size
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _get(self):
+        item = super()._get()
+        self.queued_chars -= self.record_size(item)
+        return item
+
+    def put_or_drop(self, record):
+        try:
+            self.put_nowait(record)
+        except queue.Full:
+            with self.mutex:
+                self.dropped += 1
+
+    def take_dropped(self) -> int:
+        with self.mutex:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops INFO bot output while the queue is full; everything else waits for room"""
+
+    def enqueue(self, record):
+        if record.levelno < logging.WARNING and getattr(record, 'bot_output', False):
+            self.queue.put_or_drop(record)
+        else:
+            self.queue.put(record)
+
+
+class DropReportingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that reports dropped records once the queue drains"""
+
+    report_formatter = logging.Formatter(LOG_FORMAT)
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            self.report_dropped()
+
+    def stop(self):
+        super().stop()
+        # The sentinel kept the queue non-empty for the last record
+        self.report_dropped()
+
+    def report_dropped(self):
+        dropped = self.queue.take_dropped()
+        if dropped:
+            report = logging.makeLogRecord({
+                'name': "MinimalRunner",
+                'levelno': logging.WARNING,
+                'levelname': "WARNING",
+                'msg': f"⚠️ {dropped} log records dropped",
+            })
+            report.msg = self.report_formatter.format(report)
+            super().handle(report)
+
+
 class MinimalBotRunner:
+    INFO_PATTERN = re.compile(rb'info|debug|successfully|started|initialized|connected|polling|running', re.IGNORECASE)
+    BOT_OUTPUT_EXTRA = {'bot_output': True}
+
     def __init__(self, bot_files: List[str]):
         """Initialize minimal bot runner with just file list"""
         self.bot_files = bot_files
-        self.current_processes = {}
-        self.shutdown_requested = False
+        self.current_processes: List[Optional[subprocess.Popen]] = [None] * len(bot_files)
+        self.shutdown_event = threading.Event()
         self.file_loggers = {}
-        self.restart_counts = {}
-        self.executor = ThreadPoolExecutor(max_workers=len(bot_files))
+        self.restart_counts = [0] * len(bot_files)
+        self.selector = selectors.DefaultSelector()
+        self.psutil_processes = {}
+        self.exit_watched = set()
+        self.output_pipes: List[Optional[tuple]] = [None] * len(bot_files)
+        self.start_times = [0.0] * len(bot_files)
+        self.pending_restarts: List[Optional[float]] = [None] * len(bot_files)
         
         # Fixed settings (no configuration needed)
         self.MAX_RESTARTS = 5
         self.RESTART_DELAY = 10
         self.MEMORY_LIMIT_MB = 400
+        self.MEMORY_LIMIT_BYTES = self.MEMORY_LIMIT_MB << 20
+        self.MEMORY_CHECK_INTERVAL = 30
+        self.PIPE_BUFFER_SIZE = 1 << 20
+        self.MAX_LINE_SIZE = 1 << 20
+        self.LOG_QUEUE_SIZE = 10000
+        self.LOG_QUEUE_CHARS = 16 << 20
         
         self.setup_logging()
+        self.bots = [self.create_bot_info(index, Path(file_str)) for index, file_str in enumerate(bot_files)]
+        
+        # Signals write to a self-pipe so a sleeping select() wakes up at once
+        self.wakeup_read, self.wakeup_write = os.pipe()
+        os.set_blocking(self.wakeup_read, False)
+        os.set_blocking(self.wakeup_write, False)
+        signal.set_wakeup_fd(self.wakeup_write, warn_on_full_buffer=False)
+        self.selector.register(self.wakeup_read, selectors.EVENT_READ, (self.drain_wakeup,))
         
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
@@ -36,10 +163,16 @@ class MinimalBotRunner:
 
     def setup_logging(self):
         """Simple logging setup"""
+        # All loggers only enqueue formatted records; one listener thread does the I/O
+        self.log_queue = LogQueue(self.LOG_QUEUE_SIZE, self.LOG_QUEUE_CHARS)
+        self.log_listener = DropReportingQueueListener(self.log_queue, logging.StreamHandler())
+        self.log_listener.start()
+        
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler()]
+            format=LOG_FORMAT,
+            handlers=[DroppingQueueHandler(self.log_queue)],
+            force=True  # never leave the root logger on a previous runner's stopped queue
         )
         self.logger = logging.getLogger("MinimalRunner")
 
@@ -55,45 +188,67 @@ class MinimalBotRunner:
         file_logger.setLevel(logging.INFO)
         
         formatter = logging.Formatter(f'%(asctime)s - [{file_name}] %(message)s')
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
+        queue_handler = DroppingQueueHandler(self.log_queue)
+        queue_handler.setFormatter(formatter)
         
-        file_logger.addHandler(console_handler)
+        # Loggers are process-global; drop handlers left on a previous runner's queue
+        for handler in list(file_logger.handlers):
+            file_logger.removeHandler(handler)
+        file_logger.addHandler(queue_handler)
         file_logger.propagate = False
         
         self.file_loggers[logger_name] = file_logger
         return file_logger
 
-    def is_info_message(self, message: str) -> bool:
+    def create_bot_info(self, index: int, file_path: Path) -> BotInfo:
+        """Resolve everything needed to (re)start a bot"""
+        file_logger = self.create_file_logger(file_path)
+        resolved_path = file_path.resolve()
+        
+        # Without cwd= (and with close_fds=False) Popen can take the posix_spawn fast path
+        cwd = str(resolved_path.parent)
+        if cwd == os.getcwd():
+            cwd = None
+        
+        return BotInfo(
+            index=index,
+            path=file_path,
+            path_str=str(file_path),
+            cwd=cwd,
+            argv=(sys.executable, str(resolved_path)),
+            logger=file_logger
+        )
+
+    def is_info_message(self, message: bytes) -> bool:
         """Check if stderr message is actually just info"""
-        info_keywords = ['info', 'debug', 'successfully', 'started', 'initialized', 'connected', 'polling', 'running']
-        return any(keyword in message.lower() for keyword in info_keywords)
+        return self.INFO_PATTERN.search(message) is not None
 
     def signal_handler(self, signum, frame):
-        """Handle shutdown"""
-        self.logger.info(f"🛑 Shutting down...")
-        self.shutdown_requested = True
-        self.stop_all_processes()
+        """Handle shutdown, teardown happens in the supervisor loop"""
+        self.shutdown_event.set()
+
+    def drain_wakeup(self, key: selectors.SelectorKey):
+        """Discard signal bytes written to the wakeup pipe"""
+        try:
+            while os.read(key.fd, 512):
+                pass
+        except BlockingIOError:
+            pass
 
-    def start_process(self, file_path: Path) -> Optional[subprocess.Popen]:
+    def start_process(self, bot: BotInfo) -> Optional[subprocess.Popen]:
         """Start bot process"""
-        if not file_path.exists():
-            self.logger.error(f"❌ File {file_path} not found!")
-            return None
-        
-        file_logger = self.create_file_logger(file_path)
+        file_logger = bot.logger
         
         try:
             file_logger.info("🚀 Starting...")
             
+            _, stdout_write, _, stderr_write = self.output_pipes[bot.index]
             process = subprocess.Popen(
-                [sys.executable, str(file_path)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                cwd=file_path.parent
+                bot.argv,
+                stdout=stdout_write,
+                stderr=stderr_write,
+                close_fds=bot.cwd is not None,  # posix_spawn needs close_fds=False, useless with cwd=
+                cwd=bot.cwd
             )
             
             file_logger.info(f"✅ Started with PID: {process.pid}")
@@ -103,104 +258,249 @@ class MinimalBotRunner:
             file_logger.error(f"❌ Start failed: {e}")
             return None
 
-    def monitor_output(self, file_path: Path, process: subprocess.Popen):
-        """Monitor process output"""
-        file_logger = self.create_file_logger(file_path)
+    def log_output_line(self, file_logger: logging.Logger, raw_line: bytes, is_stderr: bool):
+        """Log one raw line of child output"""
+        # Classify on raw bytes (keywords are ASCII, IGNORECASE works there too)
+        if not is_stderr or self.is_info_message(raw_line):
+            level = logging.INFO
+            msg = '%s'
+        else:
+            level = logging.ERROR
+            msg = '🚨 %s'
         
-        def read_stdout():
-            while process.poll() is None and not self.shutdown_requested:
-                try:
-                    line = process.stdout.readline()
-                    if line:
-                        file_logger.info(line.strip())
-                except:
-                    break
-                    
-        def read_stderr():
-            while process.poll() is None and not self.shutdown_requested:
-                try:
-                    line = process.stderr.readline()
-                    if line:
-                        clean_line = line.strip()
-                        if self.is_info_message(clean_line):
-                            file_logger.info(clean_line)
-                        else:
-                            file_logger.error(f"🚨 {clean_line}")
-                except:
-                    break
-        
-        threading.Thread(target=read_stdout, daemon=True).start()
-        threading.Thread(target=read_stderr, daemon=True).start()
+        # Skip decoding entirely when the level is disabled
+        if file_logger.isEnabledFor(level):
+            # Splitting already dropped '\n'; only a CRLF '\r' can be left
+            if raw_line.endswith(b'\r'):
+                raw_line = raw_line[:-1]
+            file_logger.log(level, msg, raw_line.decode('utf-8', 'replace'), extra=self.BOT_OUTPUT_EXTRA)
 
-    def monitor_memory(self, file_path: Path, process: subprocess.Popen):
-        """Simple memory monitoring"""
-        file_logger = self.create_file_logger(file_path)
+    def prepare_pipe(self, fd: int):
+        """Make pipe non-blocking and enlarge its kernel buffer"""
+        fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
         
-        def memory_check():
+        # Linux only; may fail with EPERM above /proc/sys/fs/pipe-max-size
+        if hasattr(fcntl, 'F_SETPIPE_SZ'):
             try:
-                psutil_process = psutil.Process(process.pid)
-                while process.poll() is None and not self.shutdown_requested:
-                    try:
-                        memory_mb = psutil_process.memory_info().rss / 1024 / 1024
-                        if memory_mb > self.MEMORY_LIMIT_MB:
-                            file_logger.warning(f"⚠️ High memory: {memory_mb:.1f}MB, restarting...")
-                            process.terminate()
-                            break
-                        time.sleep(30)
-                    except:
-                        break
-            except:
+                fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, self.PIPE_BUFFER_SIZE)
+            except OSError:
                 pass
+
+    def monitor_output(self, bot: BotInfo):
+        """Create bot output pipes, reused across restarts, and register them with the I/O loop"""
+        # os.pipe() fds are close-on-exec; Popen dup2()s the write ends onto the child's stdout/stderr
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        self.output_pipes[bot.index] = (stdout_read, stdout_write, stderr_read, stderr_write)
         
-        threading.Thread(target=memory_check, daemon=True).start()
+        self.prepare_pipe(stdout_read)
+        self.prepare_pipe(stderr_read)
+        self.selector.register(stdout_read, selectors.EVENT_READ, (self.read_output, bot.logger, False, bytearray()))
+        self.selector.register(stderr_read, selectors.EVENT_READ, (self.read_output, bot.logger, True, bytearray()))
 
-    def run_single_bot(self, file_path: Path):
-        """Run single bot with auto-restart"""
-        file_logger = self.create_file_logger(file_path)
-        restart_count = 0
+    def close_output(self):
+        """Close all bot output pipes"""
+        for pipes in self.output_pipes:
+            if pipes:
+                for fd in pipes:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+
+    def close_selector(self):
+        """Stop signal wakeups and close pidfds, wakeup pipe and selector"""
+        signal.set_wakeup_fd(-1)
+        for key in list(self.selector.get_map().values()):
+            if key.data[0] == self.reap_process:
+                os.close(key.fd)
+        self.exit_watched.clear()
+        self.selector.close()
+        os.close(self.wakeup_read)
+        os.close(self.wakeup_write)
+
+    def monitor_exit(self, bot: BotInfo, process: subprocess.Popen):
+        """Register process exit with the I/O loop (pidfd, Linux 5.3+)"""
+        if not hasattr(os, 'pidfd_open'):
+            return
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            return
+        self.selector.register(pidfd, selectors.EVENT_READ, (self.reap_process, bot, process))
+        self.exit_watched.add(process.pid)
+
+    def read_output(self, key: selectors.SelectorKey) -> bool:
+        """Read ready pipe and log complete lines, return False once it is empty"""
+        _, file_logger, is_stderr, tail = key.data
+        try:
+            chunk = os.read(key.fd, self.PIPE_BUFFER_SIZE)
+        except BlockingIOError:
+            return False
+        except OSError as e:
+            # The pipe stays registered: restarts keep writing into it
+            self.logger.error(f"❌ Output read failed for {file_logger.name}: {e}")
+            return False
         
-        while not self.shutdown_requested and restart_count < self.MAX_RESTARTS:
-            start_time = time.time()
-            
-            process = self.start_process(file_path)
-            if not process:
-                break
-            
-            self.current_processes[str(file_path)] = process
+        # The runner holds the write ends, so an empty read never means EOF
+        if not chunk:
+            return False
+        
+        tail += chunk
+        end = tail.rfind(b'\n')
+        if end == -1:
+            # Pathological line without newline: flush it in pieces to bound memory
+            while len(tail) > self.MAX_LINE_SIZE:
+                self.log_output_line(file_logger, bytes(tail[:self.MAX_LINE_SIZE]), is_stderr)
+                del tail[:self.MAX_LINE_SIZE]
+            return True
+        complete = bytes(tail[:end])
+        del tail[:end + 1]
+        for raw in complete.split(b'\n'):
+            self.log_output_line(file_logger, raw, is_stderr)
+        return True
+
+    def flush_output(self, bot: BotInfo):
+        """Log everything an exited process left in its pipes, including an unterminated last line"""
+        stdout_read, _, stderr_read, _ = self.output_pipes[bot.index]
+        for fd in (stdout_read, stderr_read):
+            try:
+                key = self.selector.get_key(fd)
+            except KeyError:
+                continue
+            while self.read_output(key):
+                pass
             
-            # Start monitoring
-            self.monitor_output(file_path, process)
-            self.monitor_memory(file_path, process)
+            _, file_logger, is_stderr, tail = key.data
+            if tail:
+                self.log_output_line(file_logger, bytes(tail), is_stderr)
+                tail.clear()
+
+    def reap_process(self, key: selectors.SelectorKey):
+        """Reap exited process signalled by its pidfd"""
+        _, bot, process = key.data
+        self.selector.unregister(key.fd)
+        os.close(key.fd)
+        self.exit_watched.discard(process.pid)
+        
+        # poll() does the waitpid so Popen keeps its returncode
+        process.poll()
+        if self.current_processes[bot.index] is process:
+            self.current_processes[bot.index] = None
+            self.handle_exit(bot, process)
+
+    def monitor_memory(self, file_logger: logging.Logger, process: subprocess.Popen):
+        """Register process with the memory monitor"""
+        try:
+            self.psutil_processes[process.pid] = (psutil.Process(process.pid), process, file_logger)
+        except:
+            pass
+
+    def check_memory(self):
+        """Simple memory check for all processes"""
+        for pid, (psutil_process, process, file_logger) in list(self.psutil_processes.items()):
+            try:
+                rss = psutil_process.memory_info().rss
+                if rss > self.MEMORY_LIMIT_BYTES:
+                    file_logger.warning(f"⚠️ High memory: {rss / 1024 / 1024:.1f}MB, restarting...")
+                    process.terminate()
+                    self.psutil_processes.pop(pid, None)
+            except:
+                self.psutil_processes.pop(pid, None)
+
+    def start_bot(self, bot: BotInfo):
+        """Start bot process and its monitoring"""
+        process = self.start_process(bot)
+        if not process:
+            return
+        
+        self.current_processes[bot.index] = process
+        self.start_times[bot.index] = time.time()
+        
+        # Start monitoring
+        self.monitor_exit(bot, process)
+        self.monitor_memory(bot.logger, process)
+
+    def handle_exit(self, bot: BotInfo, process: subprocess.Popen):
+        """Handle finished bot process and schedule auto-restart"""
+        file_logger = bot.logger
+        exit_code = process.returncode
+        runtime = time.time() - self.start_times[bot.index]
+        self.flush_output(bot)
+        self.psutil_processes.pop(process.pid, None)
+        
+        file_logger.info(f"📊 Ended: code={exit_code}, time={runtime:.1f}s")
+        
+        # Check if restart needed
+        if exit_code == 0:
+            file_logger.info("✅ Completed successfully")
+        elif exit_code in [130, 143, -15]:  # Manual termination
+            file_logger.info("🔄 Manual stop")
+        else:
+            restart_count = self.restart_counts[bot.index] + 1
+            self.restart_counts[bot.index] = restart_count
+            if restart_count < self.MAX_RESTARTS:
+                delay = self.RESTART_DELAY * restart_count
+                file_logger.warning(f"🔄 Restart #{restart_count} in {delay}s...")
+                self.pending_restarts[bot.index] = time.monotonic() + delay
+            else:
+                file_logger.error("🛑 Max restarts reached")
+
+    def has_active_bots(self) -> bool:
+        """Check if any bot is running or waiting for restart"""
+        return (any(process is not None for process in self.current_processes)
+                or any(restart_at is not None for restart_at in self.pending_restarts))
+
+    def supervise(self, bots: List[BotInfo]):
+        """Single loop for output, exits, restarts and memory checks"""
+        next_memory_check = time.monotonic()
+        
+        while not self.shutdown_event.is_set() and self.has_active_bots():
+            now = time.monotonic()
+            if now >= next_memory_check:
+                self.check_memory()
+                next_memory_check = now + self.MEMORY_CHECK_INTERVAL
             
-            # Wait for completion
-            exit_code = process.wait()
-            runtime = time.time() - start_time
+            timeout = next_memory_check - now
+            for bot in bots:
+                restart_at = self.pending_restarts[bot.index]
+                if restart_at is None:
+                    continue
+                if restart_at <= now:
+                    self.pending_restarts[bot.index] = None
+                    self.start_bot(bot)
+                else:
+                    timeout = min(timeout, restart_at - now)
             
-            file_logger.info(f"📊 Ended: code={exit_code}, time={runtime:.1f}s")
+            # Fallback for processes without a pidfd
+            for bot in bots:
+                process = self.current_processes[bot.index]
+                if process and process.pid not in self.exit_watched:
+                    timeout = min(timeout, 0.5)
+                    if process.poll() is not None:
+                        self.current_processes[bot.index] = None
+                        self.handle_exit(bot, process)
             
-            # Check if restart needed
-            if exit_code == 0:
-                file_logger.info("✅ Completed successfully")
-                break
-            elif exit_code in [130, 143, -15]:  # Manual termination
-                file_logger.info("🔄 Manual stop")
+            events = self.selector.select(timeout=max(timeout, 0))
+            for key, _ in events:
+                callback = key.data[0]
+                callback(key)
+        
+        if self.shutdown_event.is_set():
+            self.logger.info("🛑 Shutting down...")
+        
+        # Flush output still sitting in pipes of finished processes
+        while not self.shutdown_event.is_set():
+            events = self.selector.select(timeout=0)
+            if not events:
                 break
-            else:
-                restart_count += 1
-                if restart_count < self.MAX_RESTARTS:
-                    delay = self.RESTART_DELAY * restart_count
-                    file_logger.warning(f"🔄 Restart #{restart_count} in {delay}s...")
-                    
-                    for _ in range(delay):
-                        if self.shutdown_requested:
-                            return
-                        time.sleep(1)
-                else:
-                    file_logger.error("🛑 Max restarts reached")
+            for key, _ in events:
+                callback = key.data[0]
+                callback(key)
 
-    def stop_process(self, file_path: Path):
+    def stop_process(self, index: int):
         """Stop specific process"""
-        process = self.current_processes.get(str(file_path))
+        process = self.current_processes[index]
         if process and process.poll() is None:
             try:
                 process.terminate()
@@ -212,51 +512,47 @@ class MinimalBotRunner:
                 except:
                     pass
             finally:
-                if str(file_path) in self.current_processes:
-                    del self.current_processes[str(file_path)]
+                self.current_processes[index] = None
 
     def stop_all_processes(self):
         """Stop all processes"""
-        for file_path in list(self.current_processes.keys()):
-            self.stop_process(Path(file_path))
+        for index in range(len(self.current_processes)):
+            self.stop_process(index)
 
     def run(self):
         """Main run method"""
         self.logger.info("🚀 Starting all bots...")
         
         # Validate files
-        valid_files = []
-        for file_str in self.bot_files:
-            file_path = Path(file_str)
-            if file_path.exists():
-                valid_files.append(file_path)
-                self.logger.info(f"✅ {file_path}")
+        valid_bots = []
+        for bot in self.bots:
+            if bot.path.exists():
+                valid_bots.append(bot)
+                self.logger.info(f"✅ {bot.path_str}")
             else:
-                self.logger.error(f"❌ {file_path} not found")
+                self.logger.error(f"❌ {bot.path_str} not found")
         
-        if not valid_files:
+        if not valid_bots:
             self.logger.error("❌ No valid files!")
+            self.close_selector()
+            self.log_listener.stop()
             return
         
         try:
-            # Run all files in parallel
-            futures = []
-            for file_path in valid_files:
-                future = self.executor.submit(self.run_single_bot, file_path)
-                futures.append(future)
+            # Start all files, then supervise them from this thread
+            for bot in valid_bots:
+                self.monitor_output(bot)
+                self.start_bot(bot)
             
-            # Wait for all
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    self.logger.error(f"❌ Error: {e}")
+            self.supervise(valid_bots)
                     
         except Exception as e:
             self.logger.error(f"💥 Critical error: {e}")
         finally:
             self.stop_all_processes()
-            self.executor.shutdown(wait=True)
+            self.close_output()
+            self.close_selector()
+            self.log_listener.stop()
 
 
 def main():